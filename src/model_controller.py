@@ -711,7 +711,7 @@ class ModelController(ControllerBase):
         if model_info.flags.should_upload_all_files:
             changed_file_paths = list(model_info.model_file_paths.values())
         else:
-            changed_file_paths = model_info.file_changes.changed_or_new_files
+            changed_file_paths = list(model_info.file_changes.changed_or_new_files)
 
         logger.info(
             "Create custom inference model version. user_provided_id:  %s, from_latest: %s, "
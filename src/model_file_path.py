@@ -29,9 +29,12 @@ class ModelFilePath:
         MODEL = 1
         ROOT = 2
 
+    MAIN_PROGRAM_FILENAME = "custom.py"
+
     def __init__(self, raw_file_path, model_root_dir, workspace_path):
         self._raw_file_path = raw_file_path
         self._filepath = Path(raw_file_path)
+        self._is_main_program = self._filepath.name == self.MAIN_PROGRAM_FILENAME
         # It is important to have an indication about the path origin and the relation to
         # the model, means whether the given path was originally under the model's root dir
         # or it is supposed to be copied into it. This will help us to detect collisions
@@ -96,6 +99,11 @@ class ModelFilePath:
         """The file name"""
         return self.filepath.name
 
+    @property
+    def is_main_program(self):
+        """Whether the given file is the model's main program (custom.py)"""
+        return self._is_main_program
+
     @property
     def resolved(self):
         """The full absolute file path, after resolving all soft links"""
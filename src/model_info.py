@@ -11,11 +11,15 @@ source tree.
 import logging
 from abc import ABC
 from abc import abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import Any
 from typing import Dict
 from typing import List
+from typing import Set
+from typing import Tuple
 
 from model_file_path import ModelFilePath
 from schema_validator import ModelSchema
@@ -23,11 +27,16 @@ from schema_validator import SharedSchema
 
 logger = logging.getLogger()
 
+# A sentinel to distinguish between a missing cache entry and a cached None value.
+_MISSING = object()
+
 
 # pylint: disable=too-many-public-methods
 class InfoBase(ABC):
     """An abstract base class for models and deployments information classes."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def schema_validator(self):
@@ -134,10 +143,25 @@ class InfoBase(ABC):
         return self.set_value(SharedSchema.SETTINGS_SECTION_KEY, key, *sub_keys, value=value)
 
 
+# pylint: disable=too-many-instance-attributes
 class ModelInfo(InfoBase):
     """Holds information about a model from the local source tree."""
 
+    __slots__ = (
+        "_yaml_filepath",
+        "_model_path",
+        "_metadata",
+        "_model_file_paths",
+        "_paths_under_model_by_relative",
+        "_main_program",
+        "_value_cache",
+        "file_changes",
+        "flags",
+    )
+
     _model_file_paths: Dict[Path, ModelFilePath]
+    _paths_under_model_by_relative: Dict[ModelFilePath.RelativeTo, Set[str]]
+    _value_cache: Dict[Tuple[str, ...], Any]
 
     @dataclass
     class Flags:
@@ -156,15 +180,18 @@ class ModelInfo(InfoBase):
 
     @dataclass
     class FileChanges:
-        """Contains lists of changed/new and deleted files."""
+        """
+        Contains lists of changed/new and deleted files. The changed/new files are kept in a
+        dictionary, which is used as an insertion-ordered set.
+        """
 
-        changed_or_new_files: List[ModelFilePath] = field(default_factory=list)
+        changed_or_new_files: Dict[ModelFilePath, None] = field(default_factory=dict)
         deleted_file_ids: List[str] = field(default_factory=list)
 
         def add_changed(self, model_file_path):
             """Add model file to the changes/new list."""
 
-            self.changed_or_new_files.append(model_file_path)
+            self.changed_or_new_files[model_file_path] = None
 
         def add_deleted_file_id(self, deleted_file_id):
             """Add a file ID to the deleted file IDs list."""
@@ -172,12 +199,17 @@ class ModelInfo(InfoBase):
             self.deleted_file_ids.append(deleted_file_id)
 
     def __init__(self, yaml_filepath, model_path, metadata):
-        self._yaml_filepath = Path(yaml_filepath)
-        self._model_path = Path(model_path)
+        self._yaml_filepath = (
+            yaml_filepath if isinstance(yaml_filepath, Path) else Path(yaml_filepath)
+        )
+        self._model_path = model_path if isinstance(model_path, Path) else Path(model_path)
         self._metadata = metadata
         self._model_file_paths = {}
+        self._paths_under_model_by_relative = {}
+        self._main_program = None
         self.file_changes = self.FileChanges()
         self.flags = self.Flags()
+        self._value_cache = {}
 
     @property
     def schema_validator(self):
@@ -205,46 +237,97 @@ class ModelInfo(InfoBase):
         """A model's unique ID that is provided by the user and read from the model's metadata"""
         return self.metadata[ModelSchema.MODEL_ID_KEY]
 
+    def get_value(self, key, *sub_keys):
+        """
+        Get a value from the model's metadata given a key and sub-keys. The result is cached, so
+        repeated lookups of the same key hierarchy do not walk the metadata again. Therefore, the
+        metadata is expected to be modified only via the `set_value` method.
+
+        Parameters
+        ----------
+        key : str
+            A key name from the ModelSchema.
+        sub_keys :
+            An optional dynamic sub-keys from the ModelSchema.
+
+        Returns
+        -------
+        Any or None,
+            The value associated with the provided key (and sub-keys) or None if not exists.
+        """
+
+        key_tuple = (key,) + sub_keys
+        value = self._value_cache.get(key_tuple, _MISSING)
+        if value is _MISSING:
+            value = ModelSchema.get_value(self.metadata, key, *sub_keys)
+            self._value_cache[key_tuple] = value
+        return value
+
+    def set_value(self, key, *sub_keys, value):
+        """
+        Set a value in the model's metadata and invalidate the cached metadata values.
+
+        Parameters
+        ----------
+        key : str
+            A key name of the ModelSchema.
+        sub_keys : list
+            An optional dynamic sub-keys from the ModelSchema.
+        value : Any
+            A value to set for the given key and optionally sub keys.
+
+        Returns
+        -------
+        dict,
+            The revised metadata after the value was set.
+        """
+
+        self._value_cache.clear()
+        return super().set_value(key, *sub_keys, value=value)
+
     @property
     def model_file_paths(self):
         """A list of file paths that associated with the given model"""
         return self._model_file_paths
 
+    @property
+    def target_type(self):
+        """The model's target type, as read from the model's metadata"""
+        return self.get_value(ModelSchema.TARGET_TYPE_KEY)
+
     @property
     def is_binary(self):
         """Whether the given model's target type is binary"""
-        return ModelSchema.is_binary(self.metadata)
+        return self.target_type in ModelSchema.BINARY_TARGET_TYPES
 
     @property
     def is_regression(self):
         """Whether the given model's target type is regression"""
-        return ModelSchema.is_regression(self.metadata)
+        return self.target_type in ModelSchema.REGRESSION_TARGET_TYPES
 
     @property
     def is_unstructured(self):
         """Whether the given model's target type is unstructured"""
-        return ModelSchema.is_unstructured(self.metadata)
+        return self.target_type in ModelSchema.UNSTRUCTURED_TARGET_TYPES
 
     @property
     def is_multiclass(self):
         """Whether the given model's target type is multi-class"""
-        return ModelSchema.is_multiclass(self.metadata)
+        return self.target_type in ModelSchema.MULTICLASS_TARGET_TYPES
 
     def main_program_filepath(self):
         """Returns the main program file path of the given model"""
-        try:
-            return next(p for _, p in self.model_file_paths.items() if p.name == "custom.py")
-        except StopIteration:
-            return None
+        return self._main_program
 
     def main_program_exists(self):
         """Returns whether the main program file path exists or not"""
-        return self.main_program_filepath() is not None
+        return self._main_program is not None
 
     def set_model_paths(self, paths, workspace_path):
         """
         Builds a dictionary of the files belong to the given model. The key is a resolved
-        file path of a given file and the value is a ModelFilePath of that same file.
+        file path of a given file and the value is a ModelFilePath of that same file. The model's
+        main program file path is detected as well.
 
         Parameters
         ----------
@@ -255,14 +338,23 @@ class ModelInfo(InfoBase):
         """
 
         logger.debug("Model %s is set with the following paths: %s", self.user_provided_id, paths)
-        self._model_file_paths = {}
-        for path in paths:
-            model_filepath = ModelFilePath(path, self.model_path, workspace_path)
-            self._model_file_paths[model_filepath.resolved] = model_filepath
+        model_path = self.model_path
+        model_filepaths = [ModelFilePath(path, model_path, workspace_path) for path in paths]
+        self._model_file_paths = {mfp.resolved: mfp for mfp in model_filepaths}
+        # The unique model's file paths, after de-duplication by their resolved path
+        model_filepaths = list(self._model_file_paths.values())
+        self._main_program = next((p for p in model_filepaths if p.is_main_program), None)
+        paths_under_model_by_relative = defaultdict(set)
+        for model_filepath in model_filepaths:
+            paths_under_model_by_relative[model_filepath.relative_to].add(
+                model_filepath.under_model
+            )
+        self._paths_under_model_by_relative = dict(paths_under_model_by_relative)
 
     def paths_under_model_by_relative(self, relative_to):
         """
         Returns a list (as a set) of the model's files that subjected to specific relative value.
+        The result is pre-computed when the model paths are set.
 
         Parameters
         ----------
@@ -275,9 +367,7 @@ class ModelInfo(InfoBase):
             The list of the model's that subjected to the given input relative value.
         """
 
-        return set(
-            p.under_model for _, p in self.model_file_paths.items() if p.relative_to == relative_to
-        )
+        return self._paths_under_model_by_relative.get(relative_to, frozenset())
 
     def is_affected_by_commit(self, datarobot_latest_model_version):
         """Whether the given model is affected by the last commit"""
@@ -304,7 +394,7 @@ class ModelInfo(InfoBase):
                 "should_upload_all_files:%s changed_or_new_files:%s deleted_file_ids:%s",
                 datarobot_latest_model_version,
                 self.flags.should_upload_all_files,
-                self.file_changes.changed_or_new_files,
+                list(self.file_changes.changed_or_new_files),
                 self.file_changes.deleted_file_ids,
             )
             return True
@@ -315,15 +405,16 @@ class ModelInfo(InfoBase):
             (ModelSchema.EGRESS_NETWORK_POLICY_KEY, "networkEgressPolicy"),
         ):
             configured_resource = self.get_value(ModelSchema.VERSION_KEY, resource_key)
-            if configured_resource and configured_resource != datarobot_latest_model_version.get(
-                dr_attribute_key
-            ):
+            if not configured_resource:
+                continue
+            latest_resource = datarobot_latest_model_version.get(dr_attribute_key)
+            if configured_resource != latest_resource:
                 logger.debug(
                     "Need to create new version. Resource '%s' changed. "
                     "Configured value: '%s' Value on server: '%s'",
                     resource_key,
                     configured_resource,
-                    datarobot_latest_model_version.get(dr_attribute_key),
+                    latest_resource,
                 )
                 return True
 
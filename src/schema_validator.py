@@ -216,6 +216,22 @@ class ModelSchema(SharedSchema):
     TARGET_TYPE_UNSTRUCTURED_MULTICLASS = "Unstructured (Multiclass)"
     TARGET_TYPE_UNSTRUCTURED_OTHER = "Unstructured (Other)"
 
+    BINARY_TARGET_TYPES = frozenset([TARGET_TYPE_BINARY, TARGET_TYPE_UNSTRUCTURED_BINARY])
+    REGRESSION_TARGET_TYPES = frozenset(
+        [TARGET_TYPE_REGRESSION, TARGET_TYPE_UNSTRUCTURED_REGRESSION]
+    )
+    MULTICLASS_TARGET_TYPES = frozenset(
+        [TARGET_TYPE_MULTICLASS, TARGET_TYPE_UNSTRUCTURED_MULTICLASS]
+    )
+    UNSTRUCTURED_TARGET_TYPES = frozenset(
+        [
+            TARGET_TYPE_UNSTRUCTURED_REGRESSION,
+            TARGET_TYPE_UNSTRUCTURED_BINARY,
+            TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
+            TARGET_TYPE_UNSTRUCTURED_OTHER,
+        ]
+    )
+
     TARGET_NAME_KEY = "target_name"
 
     # Regression models
@@ -452,10 +468,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target type is Binary.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            cls.TARGET_TYPE_BINARY,
-            cls.TARGET_TYPE_UNSTRUCTURED_BINARY,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.BINARY_TARGET_TYPES
 
     @classmethod
     def is_regression(cls, metadata):
@@ -473,10 +486,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target type is Regression.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            cls.TARGET_TYPE_REGRESSION,
-            cls.TARGET_TYPE_UNSTRUCTURED_REGRESSION,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.REGRESSION_TARGET_TYPES
 
     @classmethod
     def is_multiclass(cls, metadata):
@@ -494,10 +504,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target type is MultiClass.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            cls.TARGET_TYPE_MULTICLASS,
-            cls.TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.MULTICLASS_TARGET_TYPES
 
     @classmethod
     def is_unstructured(cls, metadata):
@@ -515,12 +522,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target is unstructured.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_REGRESSION,
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_BINARY,
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_OTHER,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.UNSTRUCTURED_TARGET_TYPES
 
     @classmethod
     def validate_and_transform_single(cls, model_metadata):
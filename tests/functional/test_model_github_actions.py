@@ -316,11 +316,10 @@ class TestModelGitHubActions:
         ]
         for filepath in files_to_add_and_remove:
             if is_add:
-                with open(filepath, "w", encoding="utf-8") as fd:
-                    fd.write("# New file for testing")
+                filepath.write_text("# New file for testing", encoding="utf-8")
             else:
                 os.remove(filepath)
-            git_repo.git.add(filepath)
+        git_repo.git.add(*files_to_add_and_remove)
         commit_msg = "Add new files." if is_add else "Remove the files."
         git_repo.git.commit("-m", commit_msg)
 
@@ -10,6 +10,7 @@
 import argparse
 import contextlib
 import os
+import re
 from pathlib import Path
 
 import pytest
@@ -31,6 +32,7 @@ from dr_client import DrClient
 from model_controller import ModelController
 from model_file_path import ModelFilePath
 from model_info import ModelInfo
+from schema_validator import ModelSchema
 from tests.unit.conftest import make_a_change_and_commit
 from tests.unit.conftest import set_namespace
 from tests.unit.conftest import validate_metrics
@@ -481,20 +483,20 @@ class TestGlobPatterns:
             model_controller.collect_datarobot_model_files()
 
     @pytest.mark.parametrize(
-        "local_paths, shared_paths, collision_expected",
+        "local_paths, shared_paths, expected_collisions",
         [
-            (["/repo/model/custom.py", "/repo/model/util.py"], ["/repo/util.py"], True),
+            (["/repo/model/custom.py", "/repo/model/util.py"], ["/repo/util.py"], {"util.py"}),
             (
                 ["/repo/model/custom.py", "/repo/model/common/util.py"],
                 ["/repo/common/util.py"],
-                True,
+                {"common/util.py"},
             ),
-            (["/repo/model/common/convert.py"], ["/repo/common/util.py"], False),
-            (["/repo/model/common/util/convert.py"], ["/repo/common/util.py"], False),
+            (["/repo/model/common/convert.py"], ["/repo/common/util.py"], set()),
+            (["/repo/model/common/util/convert.py"], ["/repo/common/util.py"], set()),
             (
                 ["/repo/model/custom.py", "/repo/model/score.py"],
                 ["/repo/common/util.py", "/repo/common/common.py"],
-                False,
+                set(),
             ),
         ],
         ids=[
@@ -505,7 +507,7 @@ class TestGlobPatterns:
             "shared-package-no-collision",
         ],
     )
-    def test_local_and_shared_collisions(self, local_paths, shared_paths, collision_expected):
+    def test_local_and_shared_collisions(self, local_paths, shared_paths, expected_collisions):
         """Test collisions between local and shared file paths in a given model definition."""
 
         workspace_path = "/repo"
@@ -518,24 +520,77 @@ class TestGlobPatterns:
         with patch.object(
             ModelController, "models_info", new_callable=PropertyMock
         ) as mock_models_info_property, patch.object(
-            ModelInfo, "model_file_paths", new_callable=PropertyMock
-        ) as mock_model_file_paths_property, patch.dict(
+            ModelInfo, "user_provided_id", new_callable=PropertyMock
+        ), patch.dict(
             os.environ, {"GITHUB_WORKSPACE": workspace_path}
         ):
             model_path = Path(f"{workspace_path}/model")
             model_info = ModelInfo("yaml-path", model_path, None)
             mock_models_info_property.return_value = model_info
-            model_file_paths_property = {
-                p: ModelFilePath(p, model_path, GitHubEnv.workspace_path()) for p in local_paths
-            }
-            model_file_paths_property.update(
-                {p: ModelFilePath(p, model_path, GitHubEnv.workspace_path()) for p in shared_paths}
-            )
-            mock_model_file_paths_property.return_value = model_file_paths_property
+            model_info.set_model_paths(local_paths + shared_paths, GitHubEnv.workspace_path())
             with patch("common.git_tool.Repo.init"), patch("model_controller.DrClient"):
                 model_controller = ModelController(options, None)
-                if collision_expected:
-                    with pytest.raises(SharedAndLocalPathCollision):
+                if expected_collisions:
+                    with pytest.raises(
+                        SharedAndLocalPathCollision,
+                        match=re.escape(f"Collisions: {expected_collisions}."),
+                    ):
                         model_controller._validate_collision_between_local_and_shared(model_info)
                 else:
                     model_controller._validate_collision_between_local_and_shared(model_info)
+
+
+class TestModelInfo:
+    """Contains unit-tests for the ModelInfo class."""
+
+    def test_get_value_is_cached_and_invalidated_on_set(self):
+        """Test that metadata values are cached and the cache is invalidated on set."""
+
+        metadata = {ModelSchema.VERSION_KEY: {ModelSchema.MEMORY_KEY: 256}}
+        model_info = ModelInfo("yaml-path", "model-path", metadata)
+        with patch.object(ModelSchema, "get_value", wraps=ModelSchema.get_value) as mock_get_value:
+            for _ in range(3):
+                assert model_info.get_value(ModelSchema.VERSION_KEY, ModelSchema.MEMORY_KEY) == 256
+                assert (
+                    model_info.get_value(ModelSchema.VERSION_KEY, ModelSchema.REPLICAS_KEY) is None
+                )
+            assert mock_get_value.call_count == 2
+
+            model_info.set_value(ModelSchema.VERSION_KEY, ModelSchema.MEMORY_KEY, value=512)
+            assert model_info.get_value(ModelSchema.VERSION_KEY, ModelSchema.MEMORY_KEY) == 512
+
+    @pytest.mark.parametrize(
+        "target_type, expected_flags",
+        [
+            (ModelSchema.TARGET_TYPE_BINARY, (True, False, False, False)),
+            (ModelSchema.TARGET_TYPE_REGRESSION, (False, True, False, False)),
+            (ModelSchema.TARGET_TYPE_MULTICLASS, (False, False, True, False)),
+            (ModelSchema.TARGET_TYPE_UNSTRUCTURED_BINARY, (True, False, False, True)),
+            (ModelSchema.TARGET_TYPE_UNSTRUCTURED_OTHER, (False, False, False, True)),
+        ],
+    )
+    def test_target_type_properties(self, target_type, expected_flags):
+        """Test the target type properties and their invalidation on set."""
+
+        model_info = ModelInfo("yaml-path", "model-path", {ModelSchema.TARGET_TYPE_KEY: "x"})
+        assert not model_info.is_binary
+        model_info.set_value(ModelSchema.TARGET_TYPE_KEY, value=target_type)
+        assert (
+            model_info.is_binary,
+            model_info.is_regression,
+            model_info.is_multiclass,
+            model_info.is_unstructured,
+        ) == expected_flags
+
+    def test_add_changed_deduplicates_and_keeps_order(self):
+        """Test that changed files are recorded once and in their insertion order."""
+
+        model_path = Path("/repo/model")
+        first, second, third = (
+            ModelFilePath(f"{model_path}/{name}", model_path, "/repo")
+            for name in ["custom.py", "util.py", "score.py"]
+        )
+        file_changes = ModelInfo.FileChanges()
+        for model_filepath in [second, first, second, third, first]:
+            file_changes.add_changed(model_filepath)
+        assert list(file_changes.changed_or_new_files) == [second, first, third]
@@ -569,7 +569,7 @@ class TestCustomModelSettingsPayload:
 
         origin_name = model_info.get_settings_value(ModelSchema.NAME_KEY)
         new_name = f"{origin_name}-new"
-        model_info.metadata[ModelSchema.SETTINGS_SECTION_KEY][ModelSchema.NAME_KEY] = new_name
+        model_info.set_settings_value(ModelSchema.NAME_KEY, value=new_name)
 
         payload = DrClient.get_settings_patch_payload(model_info, datarobot_custom_model)
         assert payload[DrApiModelSettings.to_dr_attr(ModelSchema.NAME_KEY)] == new_name